@@ -1,14 +1,41 @@
 #!/usr/bin/env python3
 
+import gzip
+import hashlib
+import heapq
 import json
 import logging
 import os
+import pickle
 import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from pathlib import Path
 from typing import Any
 import requests  # type: ignore[import-untyped]
 from dotenv import load_dotenv  # type: ignore[import-untyped]
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+json_dumps: Callable[[Any], bytes]
+json_loads: Callable[[bytes | str], Any]
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    json_dumps = _stdlib_json_dumps
+    json_loads = json.loads
 
 load_dotenv()
 
@@ -19,6 +46,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+INVENTORY_PAGE_SIZE = 10000
+FETCH_WORKERS = 8
+UPDATE_BATCH_SIZE = 1500
+UPDATE_WORKERS = 4
+GZIP_MIN_BYTES = 4096
+GZIP_REJECTED_STATUSES = frozenset({400, 415, 422})
+ADJUSTMENT_SCALE = 1_000_000
+BASIS_POINTS = 10_000
+PRICE_CACHE_VERSION = 1
+PRICE_CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "manapool"
+)
+
+_DIVIDER = "=" * 80
+_TABLE_HEADER = (
+    f"{'Card':<40} {'Set':<6} {'Current':>10} {'New':>10} {'Change':>12}\n" + "-" * 80
+)
+_ROW_FORMAT = (
+    "{name:<40} {set_code:<6} ${current:>9.2f} ${new:>9.2f} "
+    "{sign}${change:>8.2f} ({change_pct:+.1f}%)"
+)
+
+_SINGLE_DEFAULTS = (
+    ("scryfall_id", None),
+    ("finish_id", "NF"),
+    ("condition_id", "NM"),
+    ("language_id", "en"),
+    ("name", "Unknown"),
+    ("set", "???"),
+)
+_get_single_fields = itemgetter(*(key for key, _ in _SINGLE_DEFAULTS))
+_get_item_fields = itemgetter("price_cents", "quantity")
+
+# finish_id -> (NM, LP+, general) price fields
+_FINISH_FIELDS = {
+    "NF": ("price_cents_nm", "price_cents_lp_plus", "price_cents"),
+    "FO": ("price_cents_nm_foil", "price_cents_lp_plus_foil", "price_cents_foil"),
+    "EF": (
+        "price_cents_nm_etched",
+        "price_cents_lp_plus_etched",
+        "price_cents_etched",
+    ),
+}
+
+
+@dataclass(slots=True)
+class PriceUpdate:
+    """A price change for one inventory line, with context for the preview."""
+
+    scryfall_id: str
+    finish_id: str
+    condition_id: str
+    language_id: str
+    price_cents: int
+    quantity: int
+    name: str
+    set_code: str
+    current_cents: int
+    delta_cents: int
+    reason: str
+    matched_by: str
+
+    def to_api(self) -> dict[str, Any]:
+        return {
+            "scryfall_id": self.scryfall_id,
+            "finish_id": self.finish_id,
+            "condition_id": self.condition_id,
+            "language_id": self.language_id,
+            "price_cents": self.price_cents,
+            "quantity": self.quantity,
+        }
+
+    def to_report(self) -> dict[str, Any]:
+        return {
+            **self.to_api(),
+            "_name": self.name,
+            "_set": self.set_code,
+            "_current_price": self.current_cents / 100,
+            "_new_price": self.price_cents / 100,
+            "_current_cents": self.current_cents,
+            "_delta_cents": self.delta_cents,
+            "_reason": self.reason,
+            "_matched_by": self.matched_by,
+        }
+
 
 class SimpleManaPoolPricer:
     """Simple pricer using only ManaPool API pricing sources."""
@@ -32,14 +144,14 @@ class SimpleManaPoolPricer:
         config_path = Path(__file__).parent / "config.json"
         if not config_path.exists():
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error("CONFIGURATION ERROR - config.json not found")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error("")
             logger.error("Please create a config.json file in the project directory.")
             logger.error("You can copy the example from the repository.")
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             sys.exit(1)
 
         try:
@@ -47,14 +159,14 @@ class SimpleManaPoolPricer:
                 config = json.load(f)
         except json.JSONDecodeError as e:
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error("CONFIGURATION ERROR - Invalid config.json")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error(f"Error: {e}")
             logger.error("")
             logger.error("Please check that config.json is valid JSON.")
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             sys.exit(1)
 
         self.base_url = os.getenv("API_BASE_URL") or config.get("api", {}).get(
@@ -66,9 +178,9 @@ class SimpleManaPoolPricer:
 
         if not all([self.base_url, self.email, self.access_token]):
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error("CONFIGURATION ERROR - Missing API Credentials")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             logger.error("")
             logger.error("Please create a .env file with your credentials:")
             logger.error("")
@@ -78,7 +190,7 @@ class SimpleManaPoolPricer:
             logger.error("     API_EMAIL=your-email@example.com")
             logger.error("     API_TOKEN=your-access-token-here")
             logger.error("")
-            logger.error("=" * 80)
+            logger.error(_DIVIDER)
             sys.exit(1)
 
         pricing_config = config.get("pricing", {})
@@ -90,10 +202,17 @@ class SimpleManaPoolPricer:
         self.price_adjustment_factor = pricing_config.get(
             "price_adjustment_factor", 1.042
         )
-
-        logger.info("=" * 80)
+        self.gzip_uploads = pricing_config.get("gzip_uploads", False)
+        self._adjustment_units = round(self.price_adjustment_factor * ADJUSTMENT_SCALE)
+        # Percentages become integer basis points so pricing stays in ints.
+        self._min_cents = round(self.min_price * 100)
+        self._lp_floor_bp = round(self.lp_floor_percent * 100)
+        self._max_keep_bp = BASIS_POINTS - round(self.max_reduction_percent * 100)
+        self._configure_strategy()
+
+        logger.info(_DIVIDER)
         logger.info("Simple ManaPool Pricer - Configuration")
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info(f"API Base URL: {self.base_url}")
         logger.info(f"Email: {self.email}")
         logger.info(f"Dry Run: {self.dry_run}")
@@ -101,7 +220,7 @@ class SimpleManaPoolPricer:
         logger.info(f"LP+ Floor: {self.lp_floor_percent}%")
         logger.info(f"Min Price: ${self.min_price}")
         logger.info(f"Max Reduction: {self.max_reduction_percent}%")
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info("")
 
     def _setup_session(self):
@@ -110,156 +229,316 @@ class SimpleManaPoolPricer:
             {
                 "X-ManaPool-Email": self.email,
                 "X-ManaPool-Access-Token": self.access_token,
-                "Accept-Encoding": "gzip, deflate",
+                # Advertises br (and zstd) only when a decoder is installed.
+                "Accept-Encoding": ACCEPT_ENCODING,
                 "Connection": "keep-alive",
             }
         )
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=10,
-            pool_maxsize=20,
-            max_retries=3,
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+            ),
+            pool_block=True,
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self._gzip_uploads = self.gzip_uploads
 
-    def fetch_inventory(self) -> list[dict[str, Any]]:
-        """Fetch all inventory from ManaPool API."""
-        logger.info("[1/4] Fetching inventory from ManaPool...")
-
-        all_items = []
-        offset = 0
-        limit = 10000
+    def _fetch_inventory_page(self, offset: int, limit: int) -> dict[str, Any]:
+        url = f"{self.base_url}/seller/inventory"
+        params = {"limit": limit, "offset": offset}
 
-        while True:
-            url = f"{self.base_url}/seller/inventory"
-            params = {"limit": limit, "offset": offset}
+        response: requests.Response = self.session.get(url, params=params, timeout=60)
+        response.raise_for_status()
+        return json_loads(response.content)
 
-            try:
-                response: requests.Response = self.session.get(
-                    url, params=params, timeout=60
-                )
-                response.raise_for_status()
-                data = response.json()
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Failed to fetch inventory: {e}")
-                sys.exit(1)
-
-            inventory = data.get("inventory", [])
-            all_items.extend(inventory)
+    def iter_inventory_pages(self) -> Iterator[list[dict[str, Any]]]:
+        """Yield inventory pages from ManaPool API in offset order.
 
-            pagination = data.get("pagination", {})
-            total = pagination.get("total", 0)
-            returned = pagination.get("returned", 0)
+        The first page reveals the total item count; the remaining pages are
+        then requested concurrently through a sliding window, so later pages
+        download while earlier ones are being processed.
+        """
+        limit = INVENTORY_PAGE_SIZE
 
-            logger.info(f"  Fetched {len(all_items):,}/{total:,} items")
+        try:
+            data = self._fetch_inventory_page(0, limit)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error(f"Failed to fetch inventory: {e}")
+            sys.exit(1)
 
-            if len(all_items) >= total or returned < limit:
-                break
+        inventory = data.get("inventory", [])
+        fetched = len(inventory)
 
-            offset += limit
+        pagination = data.get("pagination", {})
+        total = pagination.get("total", 0)
+        returned = pagination.get("returned", 0)
 
-        logger.info(f"  Total inventory items: {len(all_items):,}")
-        logger.info("")
-        return all_items
+        logger.info(f"  Fetched {fetched:,}/{total:,} items")
 
-    def fetch_prices(self) -> dict[str, dict[str, Any]]:
-        """Fetch pricing data from ManaPool API."""
-        logger.info("[2/4] Fetching price data from ManaPool...")
+        offsets = range(limit, total, limit) if returned >= limit else range(0)
+        if not offsets:
+            yield inventory
+        else:
+            # At most FETCH_WORKERS pages are requested ahead of the consumer,
+            # which bounds memory no matter how large the inventory is.
+            pending = iter(offsets)
+            with ThreadPoolExecutor(
+                max_workers=min(FETCH_WORKERS, len(offsets))
+            ) as executor:
+                futures = deque(
+                    executor.submit(self._fetch_inventory_page, offset, limit)
+                    for offset in islice(pending, FETCH_WORKERS)
+                )
+                # If the consumer stops early, close() raises GeneratorExit at
+                # a yield; drop queued pages so the executor exits promptly.
+                try:
+                    yield inventory
+
+                    while futures:
+                        try:
+                            inventory = futures.popleft().result().get("inventory", [])
+                        except (requests.exceptions.RequestException, ValueError) as e:
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            logger.error(f"Failed to fetch inventory: {e}")
+                            sys.exit(1)
+
+                        offset = next(pending, None)
+                        if offset is not None:
+                            futures.append(
+                                executor.submit(
+                                    self._fetch_inventory_page, offset, limit
+                                )
+                            )
+
+                        fetched += len(inventory)
+                        logger.info(f"  Fetched {fetched:,}/{total:,} items")
+                        yield inventory
+                except GeneratorExit:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+        logger.info(f"  Total inventory items: {fetched:,}")
+
+    def fetch_prices(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Fetch pricing data from ManaPool API.
 
+        Returns two indexes over the same price records: one keyed by
+        scryfall_id and one keyed by product id.
+        """
         url = f"{self.base_url}/prices/singles"
+        # Each API host gets its own cache so ETags never cross servers.
+        cache_dir = (
+            PRICE_CACHE_DIR / hashlib.sha1(self.base_url.encode()).hexdigest()[:12]
+        )
+        cache_path = cache_dir / f"prices-v{PRICE_CACHE_VERSION}.pkl"
+        etag_path = cache_dir / f"prices-v{PRICE_CACHE_VERSION}.etag"
+
+        headers = {}
+        if cache_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text().strip()
 
         try:
-            response: requests.Response = self.session.get(url, timeout=60)
+            response: requests.Response = self.session.get(
+                url, headers=headers, timeout=60
+            )
+            if response.status_code == 304:
+                cached = self._load_price_cache(cache_path)
+                if cached is not None:
+                    by_scryfall, by_product = cached
+                    logger.info("  Price data unchanged since last run, using cache")
+                    self._log_price_index(by_scryfall, by_product)
+                    return by_scryfall, by_product
+                response = self.session.get(url, timeout=60)
             response.raise_for_status()
-            data = response.json()
-        except requests.exceptions.RequestException as e:
+            data = json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             logger.error(f"Failed to fetch prices: {e}")
             sys.exit(1)
 
         cards = data.get("data", [])
         logger.info(f"  Received {len(cards):,} price records")
 
-        price_index = {}
-        for card in cards:
-            scryfall_id = card.get("scryfall_id")
-            if scryfall_id:
-                price_index[scryfall_id] = card
+        by_scryfall = {c["scryfall_id"]: c for c in cards if c.get("scryfall_id")}
+        by_product = {
+            product_id: c
+            for c in cards
+            if (product_id := c.get("id") or c.get("product_id"))
+        }
 
-            product_id = card.get("id") or card.get("product_id")
-            if product_id:
-                price_index[product_id] = card
+        self._save_price_cache(
+            cache_path, etag_path, response.headers.get("ETag"), by_scryfall, by_product
+        )
+        self._log_price_index(by_scryfall, by_product)
+        return by_scryfall, by_product
 
+    def _log_price_index(
+        self,
+        by_scryfall: dict[str, dict[str, Any]],
+        by_product: dict[str, dict[str, Any]],
+    ):
         logger.info(
-            f"  Indexed {len(price_index):,} unique entries (by scryfall_id and product_id)"
+            f"  Indexed {len(by_scryfall):,} entries by scryfall_id "
+            f"and {len(by_product):,} by product_id"
         )
         logger.info("")
-        return price_index
+
+    def _load_price_cache(
+        self, cache_path: Path
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]] | None:
+        """Load cached price indexes, or None if the cache is unusable.
+
+        Any failure here only costs a full download, so errors of every kind
+        are logged and ignored rather than aborting the run.
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.debug("Ignoring unreadable price cache: %s", e)
+            return None
+
+        if not (
+            isinstance(cached, tuple)
+            and len(cached) == 2
+            and all(isinstance(index, dict) for index in cached)
+        ):
+            logger.debug("Ignoring price cache with unexpected layout")
+            return None
+        return cached
+
+    def _save_price_cache(
+        self,
+        cache_path: Path,
+        etag_path: Path,
+        etag: str | None,
+        by_scryfall: dict[str, dict[str, Any]],
+        by_product: dict[str, dict[str, Any]],
+    ):
+        """Persist the price indexes for conditional refetch on the next run.
+
+        Without an ETag there is nothing to revalidate against, so any stale
+        cache is removed instead. Both files are written to temporaries and
+        swapped in with os.replace, and the old ETag is dropped first, so an
+        interrupted save can never pair an ETag with the wrong pickle.
+        """
+        cache_tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        etag_tmp = etag_path.with_name(f"{etag_path.name}.{os.getpid()}.tmp")
+        try:
+            etag_path.unlink(missing_ok=True)
+            if not etag:
+                cache_path.unlink(missing_ok=True)
+                return
+
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_tmp, "wb") as f:
+                pickle.dump((by_scryfall, by_product), f, protocol=5)
+            etag_tmp.write_text(etag)
+            os.replace(cache_tmp, cache_path)
+            os.replace(etag_tmp, etag_path)
+        except OSError as e:
+            logger.debug("Could not write price cache: %s", e)
+            cache_tmp.unlink(missing_ok=True)
+            etag_tmp.unlink(missing_ok=True)
+
+    def _configure_strategy(self):
+        """Bind the price function for the configured strategy once."""
+        self._strategy_price = {
+            "nm_only": self._price_nm_only,
+            "lp_plus": self._price_lp_plus,
+            "average": self._price_average,
+            "general_low": self._price_general_low,
+        }.get(self.pricing_strategy, self._price_nm_with_floor)
+
+    def _price_nm_only(
+        self, nm_cents: int | None, lp_plus_cents: int | None, general_cents: int | None
+    ) -> tuple[int | None, str]:
+        if nm_cents is None:
+            return None, "No NM price available"
+        return nm_cents, f"NM price: ${nm_cents / 100:.2f}"
+
+    def _price_lp_plus(
+        self, nm_cents: int | None, lp_plus_cents: int | None, general_cents: int | None
+    ) -> tuple[int | None, str]:
+        if lp_plus_cents is None:
+            return None, "No LP+ price available"
+        return lp_plus_cents, f"LP+ price: ${lp_plus_cents / 100:.2f}"
+
+    def _price_average(
+        self, nm_cents: int | None, lp_plus_cents: int | None, general_cents: int | None
+    ) -> tuple[int | None, str]:
+        prices = [p for p in [nm_cents, lp_plus_cents] if p is not None]
+        if not prices:
+            return None, "No pricing data available"
+        new_cents = (sum(prices) + len(prices) // 2) // len(prices)
+        return new_cents, f"Average of {len(prices)} sources: ${new_cents / 100:.2f}"
+
+    def _price_general_low(
+        self, nm_cents: int | None, lp_plus_cents: int | None, general_cents: int | None
+    ) -> tuple[int | None, str]:
+        if general_cents is None:
+            return None, "No general price available"
+        return general_cents, f"General/market price: ${general_cents / 100:.2f}"
+
+    def _price_nm_with_floor(
+        self, nm_cents: int | None, lp_plus_cents: int | None, general_cents: int | None
+    ) -> tuple[int | None, str]:
+        if nm_cents is None:
+            return None, "No NM price available"
+
+        new_cents = nm_cents
+        reason = f"NM: ${nm_cents / 100:.2f}"
+
+        if lp_plus_cents is not None:
+            lp_floor = (
+                lp_plus_cents * self._lp_floor_bp + BASIS_POINTS // 2
+            ) // BASIS_POINTS
+            if new_cents < lp_floor:
+                new_cents = lp_floor
+                reason += f" (LP+ floor: ${lp_floor / 100:.2f})"
+
+        return new_cents, reason
 
     def calculate_new_price(
         self,
-        current_price: float,
-        nm_price: float | None,
-        lp_plus_price: float | None,
-        general_price: float | None = None,
-    ) -> tuple[float | None, str]:
-        if self.pricing_strategy == "nm_only":
-            if nm_price is None:
-                return None, "No NM price available"
-            new_price = nm_price
-            reason = f"NM price: ${nm_price:.2f}"
-
-        elif self.pricing_strategy == "lp_plus":
-            if lp_plus_price is None:
-                return None, "No LP+ price available"
-            new_price = lp_plus_price
-            reason = f"LP+ price: ${lp_plus_price:.2f}"
-
-        elif self.pricing_strategy == "average":
-            prices = [p for p in [nm_price, lp_plus_price] if p is not None]
-            if not prices:
-                return None, "No pricing data available"
-            new_price = sum(prices) / len(prices)
-            reason = f"Average of {len(prices)} sources: ${new_price:.2f}"
-
-        elif self.pricing_strategy == "general_low":
-            if general_price is None:
-                return None, "No general price available"
-            new_price = general_price
-            reason = f"General/market price: ${general_price:.2f}"
-
-        else:  # nm_with_floor (default)
-            if nm_price is None:
-                return None, "No NM price available"
-
-            new_price = nm_price
-            reason = f"NM: ${nm_price:.2f}"
-
-            if lp_plus_price is not None:
-                lp_floor = lp_plus_price * (self.lp_floor_percent / 100.0)
-                if new_price < lp_floor:
-                    new_price = lp_floor
-                    reason += f" (LP+ floor: ${lp_floor:.2f})"
-
-        if new_price < self.min_price:
-            new_price = self.min_price
+        current_cents: int,
+        nm_cents: int | None,
+        lp_plus_cents: int | None,
+        general_cents: int | None = None,
+    ) -> tuple[int | None, str]:
+        new_cents, reason = self._strategy_price(nm_cents, lp_plus_cents, general_cents)
+        if new_cents is None:
+            return None, reason
+
+        if new_cents < self._min_cents:
+            new_cents = self._min_cents
             reason += f" (min: ${self.min_price})"
 
-        if current_price > 0:
-            max_reduction = current_price * (self.max_reduction_percent / 100.0)
-            min_allowed = current_price - max_reduction
-            if new_price < min_allowed:
-                new_price = min_allowed
+        if current_cents > 0:
+            min_allowed = (
+                current_cents * self._max_keep_bp + BASIS_POINTS // 2
+            ) // BASIS_POINTS
+            if new_cents < min_allowed:
+                new_cents = min_allowed
                 reason += f" (capped at {self.max_reduction_percent}% reduction)"
 
-        return new_price, reason
+        return new_cents, reason
 
     def process_inventory(
-        self, inventory: list[dict[str, Any]], price_data: dict[str, dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Process inventory and calculate new prices."""
-        logger.info("[3/4] Processing inventory and calculating new prices...")
+        self,
+        inventory_pages: Iterable[list[dict[str, Any]]],
+        prices_by_scryfall: dict[str, dict[str, Any]],
+        prices_by_product: dict[str, dict[str, Any]],
+    ) -> list[PriceUpdate]:
+        """Process inventory pages as they arrive and calculate new prices."""
+        logger.info("[2/3] Calculating new prices...")
 
-        updates = []
         stats = {
             "total": 0,
             "no_data": 0,
@@ -269,163 +548,154 @@ class SimpleManaPoolPricer:
             "errors": 0,
         }
 
-        for item in inventory:
+        updates = list(
+            self._iter_changes(
+                inventory_pages, prices_by_scryfall, prices_by_product, stats
+            )
+        )
+
+        logger.info("")
+        logger.info("  Processing Summary:")
+        logger.info(f"    Total cards: {stats['total']:,}")
+        logger.info(f"    No price data: {stats['no_data']:,}")
+        logger.info(f"    No change: {stats['no_change']:,}")
+        logger.info(f"    Increases: {stats['increased']:,}")
+        logger.info(f"    Decreases: {stats['decreased']:,}")
+        logger.info(f"    Errors: {stats['errors']:,}")
+        logger.info(f"    Total updates: {len(updates):,}")
+        logger.info("")
+
+        return updates
+
+    def _iter_changes(
+        self,
+        inventory_pages: Iterable[list[dict[str, Any]]],
+        prices_by_scryfall: dict[str, dict[str, Any]],
+        prices_by_product: dict[str, dict[str, Any]],
+        stats: dict[str, int],
+    ) -> Iterator[PriceUpdate]:
+        """Yield a PriceUpdate for each inventory item whose price changes."""
+        calculate_new_price = self.calculate_new_price
+        adjustment = self._adjustment_units
+        half_adjustment = adjustment // 2
+
+        for item in chain.from_iterable(inventory_pages):
             stats["total"] += 1
 
             try:
-                product = item.get("product", {})
-                single = product.get("single", {})
+                try:
+                    product = item["product"]
+                    single = product["single"]
+                except KeyError:
+                    single = None
 
                 if not single:
                     stats["no_data"] += 1
                     continue
 
-                scryfall_id = single.get("scryfall_id")
+                try:
+                    fields = _get_single_fields(single)
+                except KeyError:
+                    fields = [
+                        single.get(key, default) for key, default in _SINGLE_DEFAULTS
+                    ]
+                scryfall_id, finish, condition, language, name, set_code = fields
                 product_id = product.get("id")
 
                 card_data = None
+                matched_by = "scryfall_id"
                 if scryfall_id:
-                    card_data = price_data.get(scryfall_id)
+                    card_data = prices_by_scryfall.get(scryfall_id)
                 if not card_data and product_id:
-                    card_data = price_data.get(product_id)
+                    card_data = prices_by_product.get(product_id)
+                    matched_by = "product_id"
 
                 if not card_data:
                     stats["no_data"] += 1
                     continue
 
-                finish = single.get("finish_id", "NF")
-                condition = single.get("condition_id", "NM")
-                language = single.get("language_id", "en")
-                name = single.get("name", "Unknown")
-                set_code = single.get("set", "???")
-
-                current_price = item.get("price_cents", 0) / 100.0
+                try:
+                    current_cents, quantity = _get_item_fields(item)
+                except KeyError:
+                    current_cents = item.get("price_cents", 0)
+                    quantity = item.get("quantity", 0)
 
                 lookup_id = scryfall_id or product_id
                 if not lookup_id:
                     stats["no_data"] += 1
                     continue
 
-                nm_price = self._get_nm_price(card_data, finish)
-                lp_plus_price = self._get_lp_plus_price(card_data, finish)
-                general_price = self._get_general_price(card_data, finish)
+                price_fields = _FINISH_FIELDS.get(finish)
+                if price_fields is None:
+                    stats["no_data"] += 1
+                    continue
 
-                new_price, reason = self.calculate_new_price(
-                    current_price, nm_price, lp_plus_price, general_price
+                # Source prices are divided by the adjustment factor in
+                # integer arithmetic, rounding to the nearest cent.
+                nm_field, lp_plus_field, general_field = price_fields
+                nm_cents = card_data.get(nm_field)
+                if nm_cents is not None:
+                    nm_cents = (
+                        nm_cents * ADJUSTMENT_SCALE + half_adjustment
+                    ) // adjustment
+                lp_plus_cents = card_data.get(lp_plus_field)
+                if lp_plus_cents is not None:
+                    lp_plus_cents = (
+                        lp_plus_cents * ADJUSTMENT_SCALE + half_adjustment
+                    ) // adjustment
+                general_cents = card_data.get(general_field)
+                if general_cents is not None:
+                    general_cents = (
+                        general_cents * ADJUSTMENT_SCALE + half_adjustment
+                    ) // adjustment
+
+                new_cents, reason = calculate_new_price(
+                    current_cents, nm_cents, lp_plus_cents, general_cents
                 )
 
-                if new_price is None:
+                if new_cents is None:
                     stats["no_data"] += 1
                     continue
 
-                new_price = round(new_price, 2)
-
-                if abs(new_price - current_price) < 0.01:
+                if new_cents == current_cents:
                     stats["no_change"] += 1
                     continue
 
-                if new_price > current_price:
+                if new_cents > current_cents:
                     stats["increased"] += 1
-                elif new_price < current_price:
+                else:
                     stats["decreased"] += 1
 
-                updates.append(
-                    {
-                        "scryfall_id": lookup_id,
-                        "finish_id": finish,
-                        "condition_id": condition,
-                        "language_id": language,
-                        "price_cents": int(new_price * 100),
-                        "quantity": item.get("quantity", 0),
-                        "_name": name,
-                        "_set": set_code,
-                        "_current_price": current_price,
-                        "_new_price": new_price,
-                        "_reason": reason,
-                        "_matched_by": (
-                            "scryfall_id"
-                            if scryfall_id and price_data.get(scryfall_id)
-                            else "product_id"
-                        ),
-                    }
+                yield PriceUpdate(
+                    scryfall_id=lookup_id,
+                    finish_id=finish,
+                    condition_id=condition,
+                    language_id=language,
+                    price_cents=new_cents,
+                    quantity=quantity,
+                    name=name,
+                    set_code=set_code,
+                    current_cents=current_cents,
+                    delta_cents=new_cents - current_cents,
+                    reason=reason,
+                    matched_by=matched_by,
                 )
 
             except Exception as e:
                 stats["errors"] += 1
-                logger.debug(f"Error processing {item.get('name', 'unknown')}: {e}")
-
-        logger.info("")
-        logger.info("  Processing Summary:")
-        logger.info(f"    Total cards: {stats['total']:,}")
-        logger.info(f"    No price data: {stats['no_data']:,}")
-        logger.info(f"    No change: {stats['no_change']:,}")
-        logger.info(f"    Increases: {stats['increased']:,}")
-        logger.info(f"    Decreases: {stats['decreased']:,}")
-        logger.info(f"    Errors: {stats['errors']:,}")
-        logger.info(f"    Total updates: {len(updates):,}")
-        logger.info("")
-
-        return updates
-
-    def _get_nm_price(self, card_data: dict, finish: str) -> float | None:
-        field_map = {
-            "NF": "price_cents_nm",
-            "FO": "price_cents_nm_foil",
-            "EF": "price_cents_nm_etched",
-        }
-        field = field_map.get(finish)
-        if not field:
-            return None
-
-        price_cents = card_data.get(field)
-        if price_cents is None:
-            return None
-
-        return float(price_cents) / 100.0 / self.price_adjustment_factor
-
-    def _get_lp_plus_price(self, card_data: dict, finish: str) -> float | None:
-        field_map = {
-            "NF": "price_cents_lp_plus",
-            "FO": "price_cents_lp_plus_foil",
-            "EF": "price_cents_lp_plus_etched",
-        }
-        field = field_map.get(finish)
-        if not field:
-            return None
-
-        price_cents = card_data.get(field)
-        if price_cents is None:
-            return None
-
-        return float(price_cents) / 100.0 / self.price_adjustment_factor
-
-    def _get_general_price(self, card_data: dict, finish: str) -> float | None:
-        if finish == "NF":
-            field = "price_cents"
-        elif finish == "FO":
-            field = "price_cents_foil"
-        elif finish == "EF":
-            field = "price_cents_etched"
-        else:
-            return None
-
-        price_cents = card_data.get(field)
-        if price_cents is None:
-            return None
-
-        return float(price_cents) / 100.0 / self.price_adjustment_factor
+                logger.debug("Error processing %s: %s", item.get("name", "unknown"), e)
 
-    def apply_updates(self, updates: list[dict[str, Any]]) -> bool:
+    def apply_updates(self, updates: list[PriceUpdate]) -> bool:
         if not updates:
-            logger.info("[4/4] No updates to apply")
+            logger.info("[3/3] No updates to apply")
             return True
 
-        logger.info(f"[4/4] Reviewing {len(updates):,} price updates...")
+        logger.info(f"[3/3] Reviewing {len(updates):,} price updates...")
         logger.info("")
 
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info("PRICE CHANGE PREVIEW")
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info("")
 
         self._print_extremes(updates)
@@ -434,11 +704,15 @@ class SimpleManaPoolPricer:
         self._print_sample_updates(updates)
         logger.info("")
 
-        increases = sum(1 for u in updates if u["_new_price"] > u["_current_price"])
-        decreases = sum(1 for u in updates if u["_new_price"] < u["_current_price"])
-        total_current = sum(u["_current_price"] for u in updates)
-        total_new = sum(u["_new_price"] for u in updates)
-        total_change = total_new - total_current
+        increases = decreases = total_change_cents = 0
+        for u in updates:
+            delta = u.delta_cents
+            total_change_cents += delta
+            if delta > 0:
+                increases += 1
+            elif delta < 0:
+                decreases += 1
+        total_change = total_change_cents / 100
 
         logger.info("Summary:")
         logger.info(f"  Total updates: {len(updates):,}")
@@ -448,15 +722,15 @@ class SimpleManaPoolPricer:
         logger.info("")
 
         if self.dry_run:
-            logger.info("=" * 80)
+            logger.info(_DIVIDER)
             logger.info("DRY RUN MODE - No changes will be applied")
             logger.info("To apply changes, set dry_run = false in config.json")
-            logger.info("=" * 80)
+            logger.info(_DIVIDER)
             return True
 
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info("READY TO APPLY CHANGES")
-        logger.info("=" * 80)
+        logger.info(_DIVIDER)
         logger.info("")
         logger.info(
             f"This will update {len(updates):,} prices in your ManaPool inventory."
@@ -480,154 +754,181 @@ class SimpleManaPoolPricer:
         logger.info("Applying updates to ManaPool...")
         logger.info("")
 
-        clean_updates = []
-        for update in updates:
-            clean_updates.append(
-                {
-                    "scryfall_id": update["scryfall_id"],
-                    "finish_id": update["finish_id"],
-                    "condition_id": update["condition_id"],
-                    "language_id": update["language_id"],
-                    "price_cents": update["price_cents"],
-                    "quantity": update["quantity"],
-                }
-            )
-
-        batch_size = 1500
-        total = len(clean_updates)
-        num_batches = (total + batch_size - 1) // batch_size
+        batch_size = UPDATE_BATCH_SIZE
+        total = len(updates)
+        batches = [updates[i : i + batch_size] for i in range(0, total, batch_size)]
+        num_batches = len(batches)
 
         url = f"{self.base_url}/seller/inventory/scryfall_id"
 
-        for i in range(0, total, batch_size):
-            batch_num = i // batch_size + 1
-            batch = clean_updates[i : i + batch_size]
+        with ThreadPoolExecutor(
+            max_workers=min(UPDATE_WORKERS, num_batches)
+        ) as executor:
+            futures = {}
+            for batch_num, batch in enumerate(batches, start=1):
+                logger.info(
+                    f"  Batch {batch_num}/{num_batches}: {len(batch):,} updates..."
+                )
+                futures[executor.submit(self._post_update_batch, url, batch)] = (
+                    batch_num
+                )
 
-            logger.info(f"  Batch {batch_num}/{num_batches}: {len(batch):,} updates...")
+            # On failure, stop batches that have not started but report every
+            # batch already in flight so the seller knows what was applied.
+            failed = False
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                batch_num = futures[future]
+                try:
+                    future.result()
+                except requests.exceptions.RequestException as e:
+                    if not failed:
+                        failed = True
+                        for pending in futures:
+                            pending.cancel()
+                    logger.error(f"  Batch {batch_num}/{num_batches}: Failed - {e}")
+                    continue
 
-            try:
-                http_response: requests.Response = self.session.post(
-                    url, json=batch, timeout=120
-                )
-                http_response.raise_for_status()
                 logger.info(f"  Batch {batch_num}/{num_batches}: Success!")
-            except requests.exceptions.RequestException as e:
-                logger.error(f"  Batch {batch_num}/{num_batches}: Failed - {e}")
-                return False
+
+        if failed:
+            skipped = sum(future.cancelled() for future in futures)
+            if skipped:
+                logger.error(f"  {skipped:,} remaining batches were not sent")
+            return False
 
         logger.info("")
         logger.info(f"✓ Successfully updated {total:,} prices!")
         return True
 
-    def _print_extremes(self, updates: list[dict[str, Any]], limit: int = 10):
-        updates_with_quantity = [u for u in updates if u.get("quantity", 0) > 0]
+    def _post_update_batch(self, url: str, batch: list[PriceUpdate]):
+        """POST one batch, gzip-compressing large bodies when enabled.
+
+        If the server rejects a compressed body (400, 415 or 422), the batch is
+        resent uncompressed and compression is disabled for the rest of the
+        run. API payload dicts are only materialized here, one batch at a time.
+        """
+        body = json_dumps([u.to_api() for u in batch])
+        headers = {"Content-Type": "application/json"}
+
+        if self._gzip_uploads and len(body) > GZIP_MIN_BYTES:
+            response: requests.Response = self.session.post(
+                url,
+                data=gzip.compress(body, compresslevel=6),
+                headers={**headers, "Content-Encoding": "gzip"},
+                timeout=120,
+            )
+            if response.status_code not in GZIP_REJECTED_STATUSES:
+                response.raise_for_status()
+                return
+            # Set without a lock from worker threads: the flag only ever goes
+            # from True to False, so a racing batch at worst makes one more
+            # compressed attempt and falls back the same way.
+            self._gzip_uploads = False
 
-        sorted_by_increase = sorted(
-            updates_with_quantity,
-            key=lambda u: u["_new_price"] - u["_current_price"],
-            reverse=True,
-        )
-        sorted_by_decrease = sorted(
-            updates_with_quantity, key=lambda u: u["_new_price"] - u["_current_price"]
-        )
+        response = self.session.post(url, data=body, headers=headers, timeout=120)
+        response.raise_for_status()
 
-        logger.info(f"Top {limit} INCREASES:")
-        logger.info(
-            f"{'Card':<40} {'Set':<6} {'Current':>10} {'New':>10} {'Change':>12}"
-        )
-        logger.info("-" * 80)
-        for update in sorted_by_increase[:limit]:
-            name = update["_name"][:38]
-            set_code = update["_set"]
-            current = update["_current_price"]
-            new = update["_new_price"]
-            change = new - current
-            change_pct = (change / current * 100) if current > 0 else 0
-
-            logger.info(
-                f"{name:<40} {set_code:<6} ${current:>9.2f} ${new:>9.2f} "
-                f"+${change:>8.2f} ({change_pct:+.1f}%)"
-            )
+    def _print_extremes(self, updates: list[PriceUpdate], limit: int = 10):
+        updates_with_quantity = [u for u in updates if u.quantity > 0]
 
+        by_change = attrgetter("delta_cents")
+        top_increases = heapq.nlargest(limit, updates_with_quantity, key=by_change)
+        top_decreases = heapq.nsmallest(limit, updates_with_quantity, key=by_change)
+
+        logger.info(f"Top {limit} INCREASES:\n{self._format_table(top_increases)}")
         logger.info("")
-        logger.info(f"Top {limit} DECREASES:")
-        logger.info(
-            f"{'Card':<40} {'Set':<6} {'Current':>10} {'New':>10} {'Change':>12}"
-        )
-        logger.info("-" * 80)
-        for update in sorted_by_decrease[:limit]:
-            name = update["_name"][:38]
-            set_code = update["_set"]
-            current = update["_current_price"]
-            new = update["_new_price"]
-            change = new - current
-            change_pct = (change / current * 100) if current > 0 else 0
-
-            logger.info(
-                f"{name:<40} {set_code:<6} ${current:>9.2f} ${new:>9.2f} "
-                f"-${abs(change):>8.2f} ({change_pct:.1f}%)"
-            )
+        logger.info(f"Top {limit} DECREASES:\n{self._format_table(top_decreases)}")
 
-    def _print_sample_updates(self, updates: list[dict[str, Any]], limit: int = 20):
+    def _print_sample_updates(self, updates: list[PriceUpdate], limit: int = 20):
         logger.info("Sample price changes (first %d):", min(limit, len(updates)))
         logger.info("")
-        logger.info(
-            f"{'Card':<40} {'Set':<6} {'Current':>10} {'New':>10} {'Change':>10}"
-        )
-        logger.info("-" * 80)
-
-        for update in updates[:limit]:
-            name = update["_name"][:38]
-            set_code = update["_set"]
-            current = update["_current_price"]
-            new = update["_new_price"]
-            change = new - current
-            change_pct = (change / current * 100) if current > 0 else 0
-
-            logger.info(
-                f"{name:<40} {set_code:<6} ${current:>9.2f} ${new:>9.2f} "
-                f"{change:+9.2f} ({change_pct:+.1f}%)"
-            )
+        logger.info(self._format_table(updates[:limit]))
 
         if len(updates) > limit:
             logger.info(f"... and {len(updates) - limit:,} more")
 
         logger.info("")
 
-    def save_report(self, updates: list[dict[str, Any]]):
+    def _format_table(self, updates: list[PriceUpdate]) -> str:
+        lines = [_TABLE_HEADER]
+        for update in updates:
+            current = update.current_cents / 100
+            change = update.delta_cents / 100
+            lines.append(
+                _ROW_FORMAT.format(
+                    name=update.name[:38],
+                    set_code=update.set_code,
+                    current=current,
+                    new=update.price_cents / 100,
+                    sign="+" if change >= 0 else "-",
+                    change=abs(change),
+                    change_pct=(change / current * 100) if current > 0 else 0,
+                )
+            )
+        return "\n".join(lines)
+
+    def save_report(self, updates: list[PriceUpdate]):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"price_updates_{timestamp}.json"
 
-        report = {
+        header = {
             "timestamp": datetime.now().isoformat(),
             "dry_run": self.dry_run,
             "strategy": self.pricing_strategy,
             "total_updates": len(updates),
-            "updates": updates,
         }
 
-        with open(filename, "w") as f:
-            json.dump(report, f, indent=2)
+        # Written incrementally, one update per line, so the whole report
+        # never has to exist as a single serialized blob.
+        with open(filename, "wb") as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b'  "%s": %s,\n' % (key.encode(), json_dumps(value)))
+            f.write(b'  "updates": [\n')
+            last = len(updates) - 1
+            for i, update in enumerate(updates):
+                f.write(b"    ")
+                f.write(json_dumps(update.to_report()))
+                f.write(b",\n" if i < last else b"\n")
+            f.write(b"  ]\n}\n")
 
         logger.info(f"Detailed report saved to: {filename}")
 
     def run(self):
         try:
-            inventory = self.fetch_inventory()
-            price_data = self.fetch_prices()
-            updates = self.process_inventory(inventory, price_data)
+            logger.info("[1/3] Fetching price data and inventory from ManaPool...")
+            inventory_pages = self.iter_inventory_pages()
+            try:
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    prices_future = executor.submit(self.fetch_prices)
+                    # Priming the generator fetches the first inventory page and
+                    # dispatches the next ones while the price catalog downloads.
+                    first_page = next(inventory_pages)
+                    prices_by_scryfall, prices_by_product = prices_future.result()
+
+                updates = self.process_inventory(
+                    chain([first_page], inventory_pages),
+                    prices_by_scryfall,
+                    prices_by_product,
+                )
+            finally:
+                # Shut the page fetcher down here, not from a garbage
+                # collection pass in one of its own worker threads.
+                inventory_pages.close()
             success = self.apply_updates(updates)
 
             if updates:
                 self.save_report(updates)
 
             logger.info("")
-            logger.info("=" * 80)
+            logger.info(_DIVIDER)
             if success:
                 logger.info("Pricing completed successfully!")
             else:
                 logger.info("Pricing completed with errors")
-            logger.info("=" * 80)
+            logger.info(_DIVIDER)
 
             return 0 if success else 1
 